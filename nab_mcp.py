@@ -26,6 +26,7 @@ FEATURES:
 
 USAGE (HTTP):
     Start server: python nab_mcp.py --port 39500
+    Busy servers: add --pin-cpus to give each nab process its own core
     Fetch: curl http://localhost:39500/mcp -d '{"method":"tools/call","params":{"name":"fetch","arguments":{"url":"https://example.com"}}}'
 
 USAGE (stdio):
@@ -36,8 +37,15 @@ Created: 2026-01-15
 
 import argparse
 import asyncio
+import codecs
+import hashlib
+import itertools
+import json
 import logging
+import os
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -74,6 +82,24 @@ except ImportError:
     _Route = None  # type: ignore[assignment,misc]
     HTTP_AVAILABLE = False
 
+try:
+    import orjson as _orjson
+
+    _json_loads = _orjson.loads
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+    _json_loads = json.loads
+
+if _orjson is not None and _JSONResponse is not None:
+
+    class _ORJSONResponse(_JSONResponse):  # type: ignore[misc,valid-type]
+        """JSONResponse serialized with orjson."""
+
+        def render(self, content: Any) -> bytes:
+            return _orjson.dumps(content)
+
+    _JSONResponse = _ORJSONResponse  # type: ignore[misc]
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("nab")
@@ -88,39 +114,222 @@ if not MICROFETCH_BIN.exists():
 
 MICROFETCH_AVAILABLE = MICROFETCH_BIN.exists()
 
-# Cache for resources (fetched pages)
-_resource_cache: dict[str, dict[str, Any]] = {}
+
+class _TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._data.items() if expires <= now]:
+            del self._data[key]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+    def items(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        self._expire()
+        return ((key, value) for key, (_, value) in self._data.items())
+
+
+def _resource_id(url: str) -> str:
+    """Stable resource ID for a URL.
+
+    Unlike ``hash()``, the digest is the same in every process, so clients
+    can keep referring to a resource across server restarts; 64 bits keeps
+    collisions negligible at any realistic cache size.
+    """
+    return f"fetch_{hashlib.blake2b(url.encode(), digest_size=8).hexdigest()}"
+
+
+# Cache for resources (fetched pages): bounded, and stale after 5 minutes
+_resource_cache = _TTLCache(maxsize=1024, ttl=300.0)
+
+# Bytes read from nab's pipes per await
+_READ_CHUNK = 65536
+# stdout cap for fetches that don't ask for the full body
+_SUMMARY_MAX_BYTES = 256 * 1024
+
+# Monotonic integer clock for tool timings (bound once for the hot path)
+_perf_ns = time.perf_counter_ns
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    chunks: list[str],
+    limit: int | None = None,
+    on_limit: Callable[[], None] | None = None,
+) -> bool:
+    """Decode a subprocess pipe into ``chunks`` as data arrives.
+
+    Stops after ``limit`` bytes, calling ``on_limit`` so the writer can be
+    killed instead of producing output nobody reads. Returns True if the
+    output was cut short.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    remaining = limit
+    while chunk := await stream.read(_READ_CHUNK):
+        if remaining is not None:
+            if len(chunk) >= remaining:
+                chunks.append(decoder.decode(chunk[:remaining], final=True))
+                if on_limit is not None:
+                    on_limit()
+                return True
+            remaining -= len(chunk)
+        chunks.append(decoder.decode(chunk))
+    chunks.append(decoder.decode(b"", final=True))
+    return False
+
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes) -> None:
+    """Write ``data`` to a subprocess stdin and close it."""
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # nab exited early; its exit code tells the story
+    finally:
+        stream.close()
+
+
+def _batchable(url: str) -> bool:
+    """Whether ``nab fetch --batch`` reads ``url`` as one URL line.
+
+    nab trims each input line and skips blank and ``#`` comment lines.
+    """
+    line = url.strip()
+    return bool(line) and not line.startswith("#") and "\n" not in url
+
+
+# Cores nab children are pinned to in turn (None = no pinning, see --pin-cpus)
+_cpu_cycle: Iterator[int] | None = None
+
+
+def _pin_to_next_cpu(pid: int) -> None:
+    """Pin every thread of a nab child to the next core in round-robin order.
+
+    sched_setaffinity acts on one thread, so the main thread is pinned first
+    (threads it creates from then on inherit the mask) and then every thread
+    already running is pinned too.
+    """
+    if _cpu_cycle is None:
+        return
+    cpus = {next(_cpu_cycle)}
+    try:
+        os.sched_setaffinity(pid, cpus)
+        tids = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return  # child already exited
+    for tid in tids:
+        try:
+            os.sched_setaffinity(int(tid), cpus)
+        except OSError:
+            pass  # thread already exited
+
+
+# Identical nab invocations currently running, keyed by (args, stdin, cap)
+_inflight: dict[tuple[tuple[str, ...], str | None, int | None], asyncio.Future] = {}
 
 
 async def run_nab(
     args: list[str],
     timeout: float = 30.0,
     on_progress: Any | None = None,
+    stdin_data: str | None = None,
+    max_bytes: int | None = None,
+    coalesce: bool = False,
+) -> tuple[str, str, int]:
+    """Run nab binary with given arguments, optionally feeding stdin.
+
+    With ``max_bytes``, nab is killed once that much stdout has arrived and
+    the truncated output is returned as a success.
+
+    With ``coalesce``, concurrent calls with the same arguments share a
+    single nab process. Only fetches should ask for this; commands such as
+    bench or fingerprint must run once per call.
+    """
+    if not coalesce:
+        return await _exec_nab(args, timeout, on_progress, stdin_data, max_bytes)
+
+    key = (tuple(args), stdin_data, max_bytes)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _exec_nab(args, timeout, on_progress, stdin_data, max_bytes)
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one cancelled caller doesn't kill the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _exec_nab(
+    args: list[str],
+    timeout: float,
+    on_progress: Any | None,
+    stdin_data: str | None,
+    max_bytes: int | None,
 ) -> tuple[str, str, int]:
-    """Run nab binary with given arguments."""
+    """Spawn nab once and collect its output."""
     if not MICROFETCH_AVAILABLE:
         return "", f"nab binary not found at {MICROFETCH_BIN}", 1
 
     proc = None
     try:
+        # No cwd and close_fds=False keep CPython on its posix_spawn fast path
+        # instead of fork+exec, which copies this process's page tables.
+        # Python fds are non-inheritable by default, so nothing extra leaks.
         proc = await asyncio.create_subprocess_exec(
             str(MICROFETCH_BIN),
             *args,
+            stdin=asyncio.subprocess.PIPE if stdin_data is not None else None,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            cwd=str(MICROFETCH_DIR),
+            close_fds=False,
         )
+        _pin_to_next_cpu(proc.pid)
+
+        # Decode output incrementally instead of buffering the raw bytes
+        # and then a full decoded copy of them
+        stdout: list[str] = []
+        stderr: list[str] = []
+        io = [
+            _pump(proc.stdout, stdout, max_bytes, proc.kill),  # type: ignore[arg-type]
+            _pump(proc.stderr, stderr),  # type: ignore[arg-type]
+        ]
+        if stdin_data is not None:
+            io.append(_feed(proc.stdin, stdin_data.encode()))  # type: ignore[arg-type]
 
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=timeout,
-        )
+        done = await asyncio.wait_for(asyncio.gather(*io, proc.wait()), timeout=timeout)
 
-        return (
-            stdout.decode("utf-8", errors="replace"),
-            stderr.decode("utf-8", errors="replace"),
-            proc.returncode or 0,
-        )
+        if done[0]:
+            stdout.append(f"\n... [output truncated at {max_bytes} bytes]")
+            return "".join(stdout), "".join(stderr), 0
+        return "".join(stdout), "".join(stderr), proc.returncode or 0
     except TimeoutError:
         if proc:
             proc.kill()
@@ -138,13 +347,11 @@ server = Server("nab")
 # ============================================================================
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="fetch",
-            description="""Fetch a URL with HTTP acceleration and fingerprint spoofing.
+# Tool metadata is static: build it once instead of on every list call
+_TOOLS: list[Tool] = [
+    Tool(
+        name="fetch",
+        description="""Fetch a URL with HTTP acceleration and fingerprint spoofing.
 
 Features:
 - HTTP/2 multiplexing (100 streams/connection)
@@ -155,149 +362,160 @@ Features:
 - DNS caching
 
 Returns: Response body as text with timing info.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to fetch",
-                    },
-                    "headers": {
-                        "type": "boolean",
-                        "description": "Include response headers in output",
-                        "default": False,
-                    },
-                    "body": {
-                        "type": "boolean",
-                        "description": "Include full body (not just summary)",
-                        "default": False,
-                    },
-                    "cache": {
-                        "type": "boolean",
-                        "description": "Cache result as a resource for later access",
-                        "default": False,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to fetch",
+                },
+                "headers": {
+                    "type": "boolean",
+                    "description": "Include response headers in output",
+                    "default": False,
+                },
+                "body": {
+                    "type": "boolean",
+                    "description": "Include full body (not just summary)",
+                    "default": False,
+                },
+                "cache": {
+                    "type": "boolean",
+                    "description": "Cache result as a resource for later access",
+                    "default": False,
+                },
+                "probe": {
+                    "type": "boolean",
+                    "description": "Status and timing only: send HEAD and skip the body",
+                    "default": False,
                 },
-                "required": ["url"],
             },
-        ),
-        Tool(
-            name="fetch_batch",
-            description="""Fetch multiple URLs in parallel with HTTP acceleration.
+            "required": ["url"],
+        },
+    ),
+    Tool(
+        name="fetch_batch",
+        description="""Fetch multiple URLs in parallel with HTTP acceleration.
 
 Uses connection pooling and HTTP/2 multiplexing for maximum efficiency.
 All URLs are fetched concurrently.
 
 Returns: Results for each URL.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "urls": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of URLs to fetch",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of URLs to fetch",
                 },
-                "required": ["urls"],
             },
-        ),
-        Tool(
-            name="fetch_with_auth",
-            description="""Fetch a URL with 1Password credentials.
+            "required": ["urls"],
+        },
+    ),
+    Tool(
+        name="fetch_with_auth",
+        description="""Fetch a URL with 1Password credentials.
 
 Searches 1Password for matching credentials and includes them in the request.
 Supports username/password, TOTP, and passkeys.
 
 Returns: Response body with auth status.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to fetch (credentials matched by domain)",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to fetch (credentials matched by domain)",
                 },
-                "required": ["url"],
             },
-        ),
-        Tool(
-            name="benchmark",
-            description="""Benchmark fetching URLs with timing statistics.
+            "required": ["url"],
+        },
+    ),
+    Tool(
+        name="benchmark",
+        description="""Benchmark fetching URLs with timing statistics.
 
 Measures min/avg/max response times over multiple iterations.
 
 Returns: Benchmark results with timing statistics.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "urls": {
-                        "type": "string",
-                        "description": "Comma-separated list of URLs to benchmark",
-                    },
-                    "iterations": {
-                        "type": "integer",
-                        "description": "Number of iterations per URL",
-                        "default": 3,
-                        "minimum": 1,
-                        "maximum": 20,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "string",
+                    "description": "Comma-separated list of URLs to benchmark",
+                },
+                "iterations": {
+                    "type": "integer",
+                    "description": "Number of iterations per URL",
+                    "default": 3,
+                    "minimum": 1,
+                    "maximum": 20,
                 },
-                "required": ["urls"],
             },
-        ),
-        Tool(
-            name="fingerprint",
-            description="""Generate realistic browser fingerprints.
+            "required": ["urls"],
+        },
+    ),
+    Tool(
+        name="fingerprint",
+        description="""Generate realistic browser fingerprints.
 
 Creates browser profiles for Chrome, Firefox, or Safari.
 Includes User-Agent, Sec-CH-UA headers, Accept-Language, platform info.
 
 Returns: Generated fingerprint profiles.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "count": {
-                        "type": "integer",
-                        "description": "Number of profiles to generate",
-                        "default": 1,
-                        "minimum": 1,
-                        "maximum": 10,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "description": "Number of profiles to generate",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 10,
                 },
             },
-        ),
-        Tool(
-            name="validate",
-            description="""Run validation tests against real websites.
+        },
+    ),
+    Tool(
+        name="validate",
+        description="""Run validation tests against real websites.
 
 Tests: HTTP/2, compression, fingerprinting, TLS 1.3, 1Password integration.
 
 Returns: Validation results.""",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="auth_lookup",
-            description="""Look up credentials in 1Password for a URL.
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="auth_lookup",
+        description="""Look up credentials in 1Password for a URL.
 
 Searches 1Password for credentials matching the URL/domain.
 Returns credential info (username, TOTP availability) without exposing password.
 
 Returns: Credential info if found.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to find credentials for",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "URL to find credentials for",
                 },
-                "required": ["url"],
             },
-        ),
-    ]
+            "required": ["url"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
 
 
 @server.call_tool()
@@ -305,33 +523,58 @@ async def call_tool(
     name: str, arguments: dict[str, Any]
 ) -> list[TextContent | ImageContent | EmbeddedResource]:
     """Handle tool calls."""
-    start_time = time.time()
+    start_ns = _perf_ns()
 
     if name == "fetch":
         url = arguments.get("url", "")
         show_headers = arguments.get("headers", False)
         show_body = arguments.get("body", False)
         cache_result = arguments.get("cache", False)
+        probe = arguments.get("probe", False)
 
         args = ["fetch", url]
         if show_headers:
             args.append("--headers")
-        if show_body:
+        if probe:
+            # Liveness checks don't need the body, so don't download it
+            args.extend(["--method", "HEAD"])
+        elif show_body:
             args.append("--body")
 
-        stdout, stderr, code = await run_nab(args)
-        elapsed = time.time() - start_time
+        # Serve a fresh cached copy fetched with the same options
+        resource_id = _resource_id(url)
+        if cache_result:
+            cached = _resource_cache.get(resource_id)
+            if cached is not None and cached["args"] == args:
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"{cached['content']}\n\n[X-Cache: HIT]",
+                    )
+                ]
+
+        # Without --body only a summary is wanted; don't decode a huge page
+        max_bytes = None if show_body or probe else _SUMMARY_MAX_BYTES
+        stdout, stderr, code = await run_nab(args, max_bytes=max_bytes, coalesce=True)
+        elapsed = (_perf_ns() - start_ns) / 1e9
 
         if code != 0:
             return [TextContent(type="text", text=f"Error: {stderr}")]
 
         # Cache if requested
         if cache_result and stdout:
-            resource_id = f"fetch_{hash(url) & 0xFFFFFFFF:08x}"
             _resource_cache[resource_id] = {
                 "url": url,
+                "args": args,
                 "content": stdout,
                 "fetched_at": time.time(),
+                # Built once here so list_resources only collects them
+                "resource": Resource(
+                    uri=AnyUrl(f"nab://{resource_id}"),
+                    name=f"Fetched: {url}",
+                    description=f"Cached content from {url}",
+                    mimeType="text/plain",
+                ),
             }
 
         return [
@@ -346,19 +589,43 @@ async def call_tool(
         if not urls:
             return [TextContent(type="text", text="Error: No URLs provided")]
 
-        # Fetch all URLs concurrently
-        tasks = [run_nab(["fetch", url, "--body"]) for url in urls]
-        results = await asyncio.gather(*tasks)
-        elapsed = time.time() - start_time
+        # One nab process fetches every distinct URL concurrently over a
+        # shared client; repeated URLs reuse the first result. nab skips
+        # blank and "#" lines, so don't send those or results would shift.
+        unique = list(dict.fromkeys(filter(_batchable, urls)))
+        by_url = {}
+        # Nothing to fetch: nab would reject the empty batch outright
+        if unique:
+            args = ["fetch", "--batch", "-", "--parallel", str(len(unique)), "--format", "json"]
+            stdout, stderr, code = await run_nab(
+                args, timeout=60.0, stdin_data="\n".join(unique), coalesce=True
+            )
 
-        output_parts = []
-        for url, (stdout, stderr, code) in zip(urls, results):
             if code != 0:
-                output_parts.append(f"=== {url} ===\nError: {stderr}\n")
+                return [TextContent(type="text", text=f"Error: {stderr}")]
+            try:
+                by_url = dict(zip(unique, _json_loads(stdout)))
+            except ValueError:
+                return [TextContent(type="text", text="Error: could not parse nab batch output")]
+        elapsed = (_perf_ns() - start_ns) / 1e9
+
+        output_parts = []
+        for url in urls:
+            if _batchable(url):
+                result = by_url.get(url, {"error": "no result from nab"})
+            else:
+                result = {"error": "not a URL (blank or comment line)"}
+            if "error" in result:
+                output_parts.append(f"=== {url} ===\nError: {result['error']}\n")
             else:
                 # Truncate long outputs
-                content = stdout[:2000] + ("..." if len(stdout) > 2000 else "")
-                output_parts.append(f"=== {url} ===\n{content}\n")
+                markdown = result.get("markdown", "")
+                content = markdown[:2000] + ("..." if len(markdown) > 2000 else "")
+                output_parts.append(
+                    f"=== {url} ===\n"
+                    f"Status: {result.get('status', 0)} | {result.get('elapsed_ms', 0):.0f}ms\n"
+                    f"{content}\n"
+                )
 
         output = "\n".join(output_parts)
         output += f"\n[Fetched {len(urls)} URLs in {elapsed:.2f}s]"
@@ -368,18 +635,14 @@ async def call_tool(
     elif name == "fetch_with_auth":
         url = arguments.get("url", "")
 
-        # Look up credentials
-        auth_stdout, _, _ = await run_nab(["auth", url])
+        # Credential lookup and fetch in one nab process; the lookup
+        # summary is printed ahead of the response
+        stdout, stderr, code = await run_nab(["fetch", url, "--body", "--1password"])
+        elapsed = (_perf_ns() - start_ns) / 1e9
 
-        # Fetch with body
-        fetch_stdout, fetch_stderr, fetch_code = await run_nab(["fetch", url, "--body"])
-        elapsed = time.time() - start_time
-
-        result = f"=== 1Password Lookup ===\n{auth_stdout}\n"
-        if fetch_code != 0:
-            result += f"=== Fetch Error ===\n{fetch_stderr}\n"
-        else:
-            result += f"=== Fetch Result ===\n{fetch_stdout}\n"
+        result = f"=== Fetch Result ===\n{stdout}\n"
+        if code != 0:
+            result += f"=== Fetch Error ===\n{stderr}\n"
         result += f"\n[Total time: {elapsed:.2f}s]"
 
         return [TextContent(type="text", text=result)]
@@ -390,7 +653,7 @@ async def call_tool(
 
         args = ["bench", urls, "--iterations", str(iterations)]
         stdout, stderr, code = await run_nab(args, timeout=120.0)
-        elapsed = time.time() - start_time
+        elapsed = (_perf_ns() - start_ns) / 1e9
 
         if code != 0:
             return [TextContent(type="text", text=f"Error: {stderr}")]
@@ -415,7 +678,7 @@ async def call_tool(
 
     elif name == "validate":
         stdout, stderr, code = await run_nab(["validate"], timeout=60.0)
-        elapsed = time.time() - start_time
+        elapsed = (_perf_ns() - start_ns) / 1e9
 
         if code != 0:
             return [TextContent(type="text", text=f"Error: {stderr}")]
@@ -450,17 +713,7 @@ async def call_tool(
 @server.list_resources()
 async def list_resources() -> list[Resource]:
     """List cached resources."""
-    resources = []
-    for resource_id, data in _resource_cache.items():
-        resources.append(
-            Resource(
-                uri=AnyUrl(f"nab://{resource_id}"),
-                name=f"Fetched: {data['url']}",
-                description=f"Cached content from {data['url']}",
-                mimeType="text/plain",
-            )
-        )
-    return resources
+    return [data["resource"] for _, data in _resource_cache.items()]
 
 
 @server.read_resource()
@@ -469,9 +722,9 @@ async def read_resource(uri: AnyUrl) -> str | bytes:
     # Extract resource ID from URI
     uri_str = str(uri)
     if uri_str.startswith("nab://"):
-        resource_id = uri_str[13:]
-        if resource_id in _resource_cache:
-            return _resource_cache[resource_id]["content"]
+        cached = _resource_cache.get(uri_str[len("nab://") :])
+        if cached is not None:
+            return cached["content"]
 
     raise ValueError(f"Resource not found: {uri}")
 
@@ -481,49 +734,52 @@ async def read_resource(uri: AnyUrl) -> str | bytes:
 # ============================================================================
 
 
+_PROMPTS: list[Prompt] = [
+    Prompt(
+        name="scrape_and_analyze",
+        description="Fetch a webpage and analyze its content",
+        arguments=[
+            PromptArgument(
+                name="url",
+                description="URL to scrape and analyze",
+                required=True,
+            ),
+            PromptArgument(
+                name="focus",
+                description="What to focus on (e.g., 'prices', 'links', 'text')",
+                required=False,
+            ),
+        ],
+    ),
+    Prompt(
+        name="compare_sites",
+        description="Fetch and compare content from multiple sites",
+        arguments=[
+            PromptArgument(
+                name="urls",
+                description="Comma-separated URLs to compare",
+                required=True,
+            ),
+        ],
+    ),
+    Prompt(
+        name="auth_workflow",
+        description="Authenticate and fetch protected content",
+        arguments=[
+            PromptArgument(
+                name="url",
+                description="URL requiring authentication",
+                required=True,
+            ),
+        ],
+    ),
+]
+
+
 @server.list_prompts()
 async def list_prompts() -> list[Prompt]:
     """List available prompts."""
-    return [
-        Prompt(
-            name="scrape_and_analyze",
-            description="Fetch a webpage and analyze its content",
-            arguments=[
-                PromptArgument(
-                    name="url",
-                    description="URL to scrape and analyze",
-                    required=True,
-                ),
-                PromptArgument(
-                    name="focus",
-                    description="What to focus on (e.g., 'prices', 'links', 'text')",
-                    required=False,
-                ),
-            ],
-        ),
-        Prompt(
-            name="compare_sites",
-            description="Fetch and compare content from multiple sites",
-            arguments=[
-                PromptArgument(
-                    name="urls",
-                    description="Comma-separated URLs to compare",
-                    required=True,
-                ),
-            ],
-        ),
-        Prompt(
-            name="auth_workflow",
-            description="Authenticate and fetch protected content",
-            arguments=[
-                PromptArgument(
-                    name="url",
-                    description="URL requiring authentication",
-                    required=True,
-                ),
-            ],
-        ),
-    ]
+    return _PROMPTS
 
 
 @server.get_prompt()
@@ -730,8 +986,20 @@ def main():
         default="127.0.0.1",
         help="HTTP host (default: 127.0.0.1)",
     )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each nab process to its own core, round-robin (Linux only)",
+    )
     args = parser.parse_args()
 
+    if args.pin_cpus:
+        global _cpu_cycle
+        if hasattr(os, "sched_setaffinity"):
+            _cpu_cycle = itertools.cycle(sorted(os.sched_getaffinity(0)))
+        else:
+            logger.warning("--pin-cpus needs sched_setaffinity; not pinning")
+
     # Check binary
     if not MICROFETCH_AVAILABLE:
         logger.warning(
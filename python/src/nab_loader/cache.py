@@ -0,0 +1,135 @@
+"""Small in-process cache for fetch results with TinyLFU admission."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+# Halving every counter is a byte-wise table lookup
+_HALVE = bytes(i >> 1 for i in range(256))
+
+_MASK64 = (1 << 64) - 1
+# One odd 64-bit multiplier per sketch row
+_ROW_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+
+
+class _FrequencySketch:
+    """Count-Min sketch of recent key frequencies with 4-bit counters.
+
+    Counters saturate at 15 and are all halved after ``sample_size``
+    increments, so the sketch tracks recent popularity rather than
+    all-time counts.
+    """
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int) -> None:
+        width = 16
+        while width < capacity * 4:
+            width <<= 1
+        self._mask = width - 1
+        self._width = width
+        self._table = bytearray(width * self._DEPTH)
+        self._sample_size = max(capacity, 1) * 10
+        self._additions = 0
+
+    def _slots(self, key: Hashable) -> list:
+        # Each row multiplies by its own odd seed and takes the high bits, so
+        # keys that share a slot in one row rarely share it in the others
+        h = hash(key) & _MASK64
+        width, mask = self._width, self._mask
+        return [
+            row * width + ((((h * seed) & _MASK64) >> 32) & mask)
+            for row, seed in enumerate(_ROW_SEEDS)
+        ]
+
+    def estimate(self, key: Hashable) -> int:
+        table = self._table
+        return min(table[i] for i in self._slots(key))
+
+    def increment(self, key: Hashable) -> None:
+        table = self._table
+        for i in self._slots(key):
+            if table[i] < self._MAX_COUNT:
+                table[i] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = bytearray(self._table.translate(_HALVE))
+            self._additions //= 2
+
+
+class TinyLFUCache(Generic[V]):
+    """LRU cache that only admits a new key when it is at least as popular
+    as the entry it would evict.
+
+    Popularity comes from a frequency sketch fed by every lookup, so a
+    one-off scan over many URLs cannot flush out pages that are requested
+    again and again. Safe to share between threads.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Seconds an entry stays valid, or None to keep it until evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (monotonic expiry, value)
+        self._data: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+        self._sketch = _FrequencySketch(maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for ``key``, or None."""
+        with self._lock:
+            self._sketch.increment(key)
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store ``value`` unless the admission filter turns it away."""
+        now = time.monotonic()
+        expires = now + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            data = self._data
+            if key in data:
+                data[key] = (expires, value)
+                data.move_to_end(key)
+                return
+            # Expired entries free their slot without an admission contest
+            while data and next(iter(data.values()))[0] <= now:
+                data.popitem(last=False)
+            if len(data) >= self.maxsize:
+                if self.maxsize <= 0:
+                    return
+                victim = next(iter(data))
+                if self._sketch.estimate(key) < self._sketch.estimate(victim):
+                    return
+                del data[victim]
+            data[key] = (expires, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Number of entries that have not expired."""
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for expires, _ in self._data.values() if expires > now)
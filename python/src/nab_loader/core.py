@@ -2,12 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
+import os
 import shutil
+import socket
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from nab_loader.cache import TinyLFUCache
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class NabNotFoundError(RuntimeError):
@@ -30,7 +58,26 @@ class NabFetchError(RuntimeError):
         super().__init__(f"nab fetch failed for {url}: {reason}")
 
 
-@dataclass
+# How long to wait for a freshly spawned ``nab serve`` to accept connections.
+_DAEMON_START_TIMEOUT = 5.0
+
+# ``nab serve`` reply frames start with the payload size: 10 digits + newline.
+_FRAME_HEADER_LEN = 11
+
+# Most URLs handed to one ``nab fetch --batch`` process
+_BATCH_CHUNK = 256
+
+# Batch processes running at once: the next chunk starts while the previous
+# one is still waiting on its slowest URLs
+_BATCH_OVERLAP = 2
+
+
+# Slotted results (3.10+) skip the per-instance __dict__: less memory per
+# page and direct attribute loads when building Documents
+_RESULT_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RESULT_DATACLASS_OPTIONS)
 class NabResult:
     """Result of a single nab fetch."""
 
@@ -42,6 +89,250 @@ class NabResult:
     metadata: dict = field(default_factory=dict)
 
 
+def _document_metadata(result: NabResult) -> dict:
+    """Metadata dict for a Document built from ``result``."""
+    return {
+        "source": result.url,
+        "status": result.status,
+        "size": result.size,
+        "time_ms": result.time_ms,
+    }
+
+
+def _is_success(status: int) -> bool:
+    """Default ``accept_status`` for the integrations: 2xx responses only."""
+    return 200 <= status < 300
+
+
+def _accepted(
+    results: Iterable[NabResult], accept_status: Optional[Callable[[int], bool]]
+) -> Iterable[NabResult]:
+    """Results whose status passes ``accept_status`` (all if None)."""
+    if accept_status is None:
+        return results
+    return (r for r in results if accept_status(r.status))
+
+
+def _results_to_arrow(results: Iterable[NabResult]) -> pa.RecordBatch:
+    """Column-wise RecordBatch of ``results`` (needs the ``arrow`` extra)."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Arrow output: pip install nab-loader[arrow]"
+        ) from None
+
+    results = list(results)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array([r.markdown for r in results], type=pa.large_string()),
+            pa.array([r.url for r in results], type=pa.string()),
+            pa.array([r.status for r in results], type=pa.uint16()),
+            pa.array([r.size for r in results], type=pa.int64()),
+            pa.array([r.time_ms for r in results], type=pa.float64()),
+        ],
+        names=["page_content", "source", "status", "size", "time_ms"],
+    )
+
+
+def _result_from_json(
+    url: str, meta: dict, markdown: Optional[str] = None
+) -> NabResult:
+    """Build a NabResult from one ``nab fetch --format json`` object.
+
+    nab reports timing as ``elapsed_ms`` and the body size in bytes as
+    ``metadata.content_length``.
+    """
+    if markdown is None:
+        markdown = meta.get("markdown", "")
+    size = (meta.get("metadata") or {}).get("content_length", len(markdown))
+    return NabResult(
+        url=meta.get("url", url),
+        markdown=markdown,
+        status=meta.get("status", 0),
+        size=size,
+        time_ms=meta.get("elapsed_ms", 0.0),
+        metadata=meta,
+    )
+
+
+def _failed_result(url: str) -> NabResult:
+    """Placeholder for a URL that could not be fetched."""
+    return NabResult(url=url, markdown="", status=0, size=0, time_ms=0.0)
+
+
+def _result_from_output(url: str, stdout: bytes) -> NabResult:
+    """Build a NabResult from one-shot ``nab fetch --format json`` output."""
+    # nab --format json outputs JSON on first line; anything after it is
+    # body. Parse the header straight from bytes; only the body is decoded.
+    header, _, body = stdout.partition(b"\n")
+    if not header:
+        raise NabFetchError(url, "nab produced no output")
+    try:
+        meta = _json_loads(header)
+    except ValueError:
+        raise NabFetchError(url, "could not parse nab JSON output")
+
+    markdown = body.decode("utf-8", errors="replace") if body else None
+    return _result_from_json(url, meta, markdown)
+
+
+def _batchable(url: str) -> bool:
+    """Whether ``nab fetch --batch`` reads ``url`` as one URL line.
+
+    nab trims each input line and skips blank and ``#`` comment lines, so
+    such URLs get no result and must not take a slot in the output.
+    """
+    line = url.strip()
+    return bool(line) and not line.startswith("#") and "\n" not in url
+
+
+def _batch_input(urls: List[str]) -> bytes:
+    """stdin for ``nab fetch --batch -``: the URLs nab will actually fetch."""
+    return "\n".join(filter(_batchable, urls)).encode()
+
+
+def _results_from_batch(urls: List[str], items: list) -> List[NabResult]:
+    """Line up ``nab fetch --batch --format json`` items with their URLs."""
+    # nab answers in input order for the lines it accepts (see _batchable),
+    # so slot each answer straight into its URL's place
+    results: List[Optional[NabResult]] = [None] * len(urls)
+    answers = iter(items)
+    for i, url in enumerate(urls):
+        item = next(answers, None) if _batchable(url) else None
+        if item and "error" not in item:
+            results[i] = _result_from_json(url, item)
+        else:
+            results[i] = _failed_result(url)
+    return results  # type: ignore[return-value]
+
+
+class _NabDaemon:
+    """A long-lived ``nab serve`` worker reached over a Unix socket.
+
+    Requests are single JSON lines; each reply is a 10-digit length prefix
+    and newline followed by exactly that many bytes of JSON, so the reply is
+    read in one exact-size read with no line scanning. Each thread gets its own
+    connection so concurrent fetches don't serialize on one stream, and the
+    worker is respawned if it dies. The worker exits on its own when our end
+    of its stdin pipe closes, so it never outlives this process.
+    """
+
+    def __init__(self, binary: str, options: List[str], timeout: int) -> None:
+        self._binary = binary
+        self._options = options
+        self._timeout = timeout
+        self._path = os.path.join(
+            tempfile.gettempdir(), f"nab-{os.getpid()}-{id(self):x}.sock"
+        )
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._proc: Optional[subprocess.Popen] = None
+        self._generation = 0
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        """Spawn the worker unless it is already alive."""
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                return
+            self._generation += 1
+            self._proc = subprocess.Popen(
+                [
+                    self._binary,
+                    "serve",
+                    "--socket",
+                    self._path,
+                    "--exit-with-stdin",
+                    *self._options,
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+            deadline = time.monotonic() + _DAEMON_START_TIMEOUT
+            while True:
+                if self._proc.poll() is not None:
+                    raise OSError(f"nab serve exited with code {self._proc.returncode}")
+                try:
+                    self._connect().close()
+                    return
+                except (FileNotFoundError, ConnectionRefusedError):
+                    if time.monotonic() > deadline:
+                        self._proc.kill()
+                        raise OSError("nab serve did not start listening")
+                    time.sleep(0.01)
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self._path)
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(self._timeout)
+        return sock
+
+    def _connection(self):
+        """Return this thread's (socket, reader) pair, connecting if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn[0] != self._generation:
+            self._drop_connection()
+            sock = self._connect()
+            conn = (self._generation, sock, sock.makefile("rb"))
+            self._local.conn = conn
+        return conn[1], conn[2]
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn[2].close()
+            conn[1].close()
+            self._local.conn = None
+
+    def request(self, url: str) -> dict:
+        """Fetch ``url`` through the worker and return its JSON result."""
+        line = (json.dumps({"url": url}) + "\n").encode()
+        try:
+            return self._roundtrip(line)
+        except (ConnectionError, FileNotFoundError):
+            # The worker died under us: respawn it and retry once.
+            self._ensure_running()
+        return self._roundtrip(line)
+
+    def _roundtrip(self, line: bytes) -> dict:
+        try:
+            sock, reader = self._connection()
+            sock.sendall(line)
+            header = reader.read(_FRAME_HEADER_LEN)
+            size = int(header) if len(header) == _FRAME_HEADER_LEN else -1
+            reply = reader.read(size) if size >= 0 else b""
+        except (OSError, ValueError):
+            # Never reuse a stream that may still have a reply in flight.
+            self._drop_connection()
+            raise
+        if size < 0 or len(reply) != size:
+            self._drop_connection()
+            raise ConnectionResetError("nab serve closed the connection")
+        return _json_loads(reply)
+
+    def close(self) -> None:
+        """Stop the worker and remove its socket."""
+        self._drop_connection()
+        with self._lock:
+            if self._proc is not None:
+                if self._proc.stdin is not None:
+                    self._proc.stdin.close()
+                try:
+                    self._proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    self._proc.kill()
+                self._proc = None
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+
 class NabLoader:
     """Fetch web content via the nab CLI and return structured results.
 
@@ -49,6 +340,21 @@ class NabLoader:
         binary: Path to the nab binary. Defaults to finding it on PATH.
         cookies: Cookie source (auto, brave, chrome, firefox, none).
         timeout: Subprocess timeout in seconds per URL.
+        daemon: Keep one ``nab serve`` worker alive and send every fetch to
+            it, so process startup, TLS sessions and DNS lookups are paid
+            once. The worker is started by the first single-URL fetch; batch
+            fetches don't use it. Falls back to one subprocess per URL if
+            the worker cannot be started (e.g. an older nab without
+            ``serve``). DNS answers
+            are cached in the worker for their TTL, so prefer one long-lived
+            loader over many short ones.
+        prefer_encoding: Accept-Encoding to advertise instead of the browser
+            profile's (e.g. "zstd, br, gzip"). None, the default, keeps the
+            profile's own header so requests still look like that browser.
+        cache_size: Keep up to this many successful results in memory and
+            serve repeat URLs from there (0 disables).
+        cache_ttl: Seconds a cached result is served before the URL is
+            fetched again; None keeps it until evicted.
     """
 
     def __init__(
@@ -56,31 +362,144 @@ class NabLoader:
         binary: Optional[str] = None,
         cookies: str = "auto",
         timeout: int = 30,
+        daemon: bool = True,
+        prefer_encoding: Optional[str] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
     ) -> None:
         self.binary = binary or shutil.which("nab")
         if self.binary is None:
             raise NabNotFoundError()
         self.cookies = cookies
         self.timeout = timeout
+        self.prefer_encoding = prefer_encoding
+        # Fetches currently running, so concurrent callers asking for the
+        # same URL wait on one fetch instead of starting their own
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._cache: Optional[TinyLFUCache[NabResult]] = (
+            TinyLFUCache(cache_size, cache_ttl) if cache_size > 0 else None
+        )
+        self._daemon: Optional[_NabDaemon] = None
+        # Whether the worker should still be started on first use
+        self._daemon_wanted = daemon and hasattr(socket, "AF_UNIX")
+        self._daemon_lock = threading.Lock()
+
+    def _options(self) -> List[str]:
+        """Flags shared by every nab invocation this loader makes."""
+        options = ["--cookies", self.cookies]
+        if self.prefer_encoding:
+            options += ["--accept-encoding", self.prefer_encoding]
+        return options
+
+    def close(self) -> None:
+        """Shut down the background nab worker, if any."""
+        with self._daemon_lock:
+            self._daemon_wanted = False
+            if self._daemon is not None:
+                self._daemon.close()
+                self._daemon = None
+
+    def _worker(self) -> Optional[_NabDaemon]:
+        """The ``nab serve`` worker, started on first call; None if unused."""
+        if self._daemon_wanted:
+            with self._daemon_lock:
+                if self._daemon_wanted:
+                    try:
+                        self._daemon = _NabDaemon(
+                            self.binary, self._options(), self.timeout
+                        )
+                    except OSError:
+                        self._daemon = None
+                    self._daemon_wanted = False
+        return self._daemon
+
+    def __enter__(self) -> "NabLoader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def fetch(self, url: str) -> NabResult:
-        """Fetch a single URL and return structured result."""
-        cmd = [
-            self.binary,
-            "fetch",
-            url,
-            "--format",
-            "json",
-            "--cookies",
-            self.cookies,
-            "--body",
-        ]
+        """Fetch a single URL and return structured result.
+
+        Concurrent calls for the same URL (e.g. from several threads) share
+        one underlying fetch and receive the same result or error.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(url)
+            if cached is not None:
+                return cached
+
+        with self._inflight_lock:
+            pending = self._inflight.get(url)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[url] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            result = self._fetch_one(url)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(result)
+            self._remember(url, result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[url]
+
+    def _remember(self, url: str, result: NabResult) -> None:
+        """Cache ``result`` if it is a 2xx; errors are retried next time."""
+        if self._cache is not None and _is_success(result.status):
+            self._cache.put(url, result)
+
+    def _split_cached(
+        self, urls: List[str]
+    ) -> Tuple[List[Optional[NabResult]], List[str]]:
+        """Cached results by position (None if missing) and the URLs to fetch.
+
+        URLs to fetch are deduplicated, keeping first-seen order.
+        """
+        if self._cache is None:
+            return [None] * len(urls), list(dict.fromkeys(urls))
+        cached = [self._cache.get(url) for url in urls]
+        misses = dict.fromkeys(url for url, hit in zip(urls, cached) if hit is None)
+        return cached, list(misses)
+
+    def _merge_fetched(
+        self,
+        urls: List[str],
+        cached: List[Optional[NabResult]],
+        misses: List[str],
+        fetched: List[NabResult],
+    ) -> List[NabResult]:
+        """Fill the gaps in ``cached`` with ``fetched``, caching successes."""
+        if self._cache is None and len(misses) == len(urls):
+            return fetched
+        by_url = dict(zip(misses, fetched))
+        for url, result in by_url.items():
+            self._remember(url, result)
+        return [by_url[url] if hit is None else hit for url, hit in zip(urls, cached)]
+
+    def _fetch_one(self, url: str) -> NabResult:
+        """Fetch a URL via the worker, or a one-shot nab process."""
+        daemon = self._worker()
+        if daemon is not None:
+            return self._fetch_daemon(daemon, url)
+
         try:
+            # No cwd and close_fds=False keep CPython on its posix_spawn fast
+            # path instead of fork+exec; this and every other nab spawn here
+            # use it. Python fds are non-inheritable, so nothing extra leaks.
             proc = subprocess.run(
-                cmd,
+                self._fetch_cmd(url),
                 capture_output=True,
-                text=True,
                 timeout=self.timeout,
+                close_fds=False,
             )
         except FileNotFoundError:
             raise NabNotFoundError()
@@ -88,50 +507,291 @@ class NabLoader:
             raise NabFetchError(url, f"timed out after {self.timeout}s")
 
         if proc.returncode != 0:
-            raise NabFetchError(url, proc.stderr.strip() or f"exit code {proc.returncode}")
+            stderr = proc.stderr.decode("utf-8", errors="replace").strip()
+            raise NabFetchError(url, stderr or f"exit code {proc.returncode}")
+
+        return _result_from_output(url, proc.stdout)
 
-        # nab --format json outputs JSON on first line, body follows
-        lines = proc.stdout.split("\n", 1)
+    def _fetch_daemon(self, daemon: _NabDaemon, url: str) -> NabResult:
+        """Fetch a URL through the persistent ``nab serve`` worker."""
         try:
-            meta = json.loads(lines[0])
-        except (json.JSONDecodeError, IndexError):
-            raise NabFetchError(url, "could not parse nab JSON output")
-
-        markdown = lines[1] if len(lines) > 1 else ""
-
-        return NabResult(
-            url=meta.get("url", url),
-            markdown=markdown,
-            status=meta.get("status", 0),
-            size=meta.get("size", len(markdown)),
-            time_ms=meta.get("time_ms", 0.0),
-            metadata=meta,
-        )
+            meta = daemon.request(url)
+        except socket.timeout:
+            raise NabFetchError(url, f"timed out after {self.timeout}s")
+        except (OSError, ValueError) as e:
+            raise NabFetchError(url, str(e) or type(e).__name__)
+
+        if "error" in meta:
+            raise NabFetchError(url, meta["error"])
+
+        return _result_from_json(url, meta)
 
     def fetch_batch(self, urls: List[str], parallel: int = 5) -> List[NabResult]:
         """Fetch multiple URLs in parallel.
 
+        URLs go to ``nab fetch --batch`` in chunks of up to 256 per process;
+        each process shares one connection pool across its URLs and
+        multiplexes same-host requests. Chunking bounds each process's
+        output and timeout, so one stuck chunk only fails its own URLs.
+        Two chunk processes run at a time, so a slow URL at the end of one
+        chunk does not hold up the next.
+
         Args:
             urls: List of URLs to fetch.
-            parallel: Maximum concurrent fetches.
+            parallel: Maximum concurrent fetches per nab process.
 
         Returns:
-            List of NabResult in the same order as input URLs.
+            List of NabResult in the same order as input URLs. A URL listed
+            more than once is fetched once and its result repeated.
             Failed fetches are included with empty markdown and status=0.
         """
-        results: dict[int, NabResult] = {}
+        cached, misses = self._split_cached(urls)
+        if not misses:
+            return cached  # type: ignore[return-value]
 
-        with ThreadPoolExecutor(max_workers=parallel) as pool:
-            future_to_idx = {pool.submit(self._safe_fetch, url): i for i, url in enumerate(urls)}
-            for future in as_completed(future_to_idx):
-                idx = future_to_idx[future]
-                results[idx] = future.result()
+        chunks = [
+            misses[start : start + _BATCH_CHUNK]
+            for start in range(0, len(misses), _BATCH_CHUNK)
+        ]
+        if len(chunks) == 1:
+            fetched = self._run_batch_chunk(chunks[0], parallel)
+        else:
+            with ThreadPoolExecutor(max_workers=_BATCH_OVERLAP) as pool:
+                fetched = [
+                    result
+                    for results in pool.map(
+                        lambda chunk: self._run_batch_chunk(chunk, parallel), chunks
+                    )
+                    for result in results
+                ]
 
-        return [results[i] for i in range(len(urls))]
+        return self._merge_fetched(urls, cached, misses, fetched)
 
-    def _safe_fetch(self, url: str) -> NabResult:
-        """Fetch a URL, returning an error result instead of raising."""
+    def _run_batch_chunk(self, chunk: List[str], parallel: int) -> List[NabResult]:
+        """Fetch one chunk of URLs with a single ``nab fetch --batch`` process."""
         try:
-            return self.fetch(url)
-        except (NabFetchError, NabNotFoundError):
-            return NabResult(url=url, markdown="", status=0, size=0, time_ms=0.0)
+            proc = subprocess.run(
+                self._batch_cmd(parallel),
+                input=_batch_input(chunk),
+                capture_output=True,
+                timeout=self._batch_timeout(len(chunk), parallel),
+                close_fds=False,
+            )
+            items = _json_loads(proc.stdout) if proc.returncode == 0 else []
+        except FileNotFoundError:
+            raise NabNotFoundError()
+        except (subprocess.TimeoutExpired, ValueError):
+            items = []
+        return _results_from_batch(chunk, items)
+
+    def fetch_batch_iter(
+        self, urls: List[str], parallel: int = 5
+    ) -> Iterator[NabResult]:
+        """Fetch URLs concurrently, yielding each result as it completes.
+
+        At most ``parallel`` fetches are in flight, and a new one starts only
+        when a finished result has been taken, so a slow consumer holds
+        back the fetching rather than letting results pile up.
+
+        Results arrive in completion order, not input order. Failed fetches
+        are yielded with empty markdown and status=0, as in fetch_batch.
+        """
+        pending_urls = iter(urls)
+        with ThreadPoolExecutor(max_workers=max(parallel, 1)) as pool:
+            running: Dict[Future, str] = {}
+            for url in pending_urls:
+                running[pool.submit(self.fetch, url)] = url
+                if len(running) >= parallel:
+                    break
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = running.pop(future)
+                    try:
+                        yield future.result()
+                    except NabFetchError:
+                        yield _failed_result(url)
+                    next_url = next(pending_urls, None)
+                    if next_url is not None:
+                        running[pool.submit(self.fetch, next_url)] = next_url
+
+    async def afetch(self, url: str) -> NabResult:
+        """Async variant of :meth:`fetch`.
+
+        With the worker running, the fetch runs in the event loop's default
+        executor (the worker is shared with sync callers); otherwise nab is
+        spawned with ``asyncio.create_subprocess_exec``.
+        """
+        loop = asyncio.get_running_loop()
+        if self._daemon_wanted:
+            # Starting the worker waits for its socket; not on the event loop
+            await loop.run_in_executor(None, self._worker)
+        if self._daemon is not None:
+            return await loop.run_in_executor(None, self.fetch, url)
+        if self._cache is not None:
+            cached = self._cache.get(url)
+            if cached is not None:
+                return cached
+
+        stdout, stderr, returncode = await self._arun(
+            self._fetch_cmd(url), None, self.timeout
+        )
+        if returncode is None:
+            raise NabFetchError(url, f"timed out after {self.timeout}s")
+        if returncode != 0:
+            message = stderr.decode("utf-8", errors="replace").strip()
+            raise NabFetchError(url, message or f"exit code {returncode}")
+        result = _result_from_output(url, stdout)
+        self._remember(url, result)
+        return result
+
+    async def afetch_batch(
+        self, urls: List[str], parallel: int = 5
+    ) -> List[NabResult]:
+        """Async variant of :meth:`fetch_batch`; same chunked nab processes."""
+        cached, misses = self._split_cached(urls)
+        if not misses:
+            return cached  # type: ignore[return-value]
+
+        limit = asyncio.Semaphore(_BATCH_OVERLAP)
+
+        async def run_chunk(chunk: List[str]) -> List[NabResult]:
+            async with limit:
+                stdout, _, returncode = await self._arun(
+                    self._batch_cmd(parallel),
+                    _batch_input(chunk),
+                    self._batch_timeout(len(chunk), parallel),
+                )
+            try:
+                items = _json_loads(stdout) if returncode == 0 else []
+            except ValueError:
+                items = []
+            return _results_from_batch(chunk, items)
+
+        chunk_results = await asyncio.gather(
+            *(
+                run_chunk(misses[start : start + _BATCH_CHUNK])
+                for start in range(0, len(misses), _BATCH_CHUNK)
+            )
+        )
+        fetched = [result for results in chunk_results for result in results]
+
+        return self._merge_fetched(urls, cached, misses, fetched)
+
+    async def afetch_batch_iter(
+        self, urls: List[str], parallel: int = 5
+    ) -> AsyncIterator[NabResult]:
+        """Async variant of :meth:`fetch_batch_iter`.
+
+        Yields results in completion order with at most ``parallel`` fetches
+        running; failed fetches are yielded with status=0.
+        """
+        limit = asyncio.Semaphore(max(parallel, 1))
+
+        async def fetch_one(url: str) -> NabResult:
+            async with limit:
+                try:
+                    return await self.afetch(url)
+                except NabFetchError:
+                    return _failed_result(url)
+
+        tasks = [asyncio.ensure_future(fetch_one(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _fetch_cmd(self, url: str) -> List[str]:
+        return [
+            self.binary,
+            "fetch",
+            url,
+            "--format",
+            "json",
+            "--body",
+            *self._options(),
+        ]
+
+    def _batch_cmd(self, parallel: int) -> List[str]:
+        return [
+            self.binary,
+            "fetch",
+            "--batch",
+            "-",
+            "--parallel",
+            str(parallel),
+            "--format",
+            "json",
+            *self._options(),
+        ]
+
+    def _batch_timeout(self, count: int, parallel: int) -> float:
+        # nab runs `parallel` fetches at a time, each bounded by the timeout.
+        waves = -(-count // max(parallel, 1))
+        return self.timeout * waves
+
+    async def _arun(
+        self, cmd: List[str], stdin: Optional[bytes], timeout: float
+    ) -> Tuple[bytes, bytes, Optional[int]]:
+        """Run nab without blocking the event loop.
+
+        Returns ``(stdout, stderr, returncode)``; returncode is None when
+        the process was killed for exceeding ``timeout``.
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=subprocess.DEVNULL if stdin is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            raise NabNotFoundError()
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(stdin), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return b"", b"", None
+        return stdout, stderr, proc.returncode
+
+
+# Loaders shared by the LangChain/LlamaIndex integrations, so every
+# NabWebLoader/NabWebReader with the same settings reuses one nab worker
+_shared_loaders: Dict[tuple, NabLoader] = {}
+_shared_loaders_lock = threading.Lock()
+
+
+def _shared_loader(
+    binary: Optional[str],
+    cookies: str,
+    cache_size: int,
+    cache_ttl: Optional[float],
+) -> NabLoader:
+    """Return the process-wide NabLoader for these settings.
+
+    Integrations built with the same settings also share its result cache,
+    so a page loaded for LangChain is not fetched again for LlamaIndex.
+    """
+    key = (binary, cookies, cache_size, cache_ttl)
+    with _shared_loaders_lock:
+        loader = _shared_loaders.get(key)
+        if loader is None:
+            loader = _shared_loaders[key] = NabLoader(
+                binary=binary,
+                cookies=cookies,
+                cache_size=cache_size,
+                cache_ttl=cache_ttl,
+            )
+        return loader
+
+
+@atexit.register
+def _close_shared_loaders() -> None:
+    with _shared_loaders_lock:
+        for loader in _shared_loaders.values():
+            loader.close()
+        _shared_loaders.clear()
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Iterator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
 
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
 
-from nab_loader.core import NabLoader
+from nab_loader.core import (
+    NabResult,
+    _accepted,
+    _document_metadata,
+    _is_success,
+    _results_to_arrow,
+    _shared_loader,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _to_document(result: NabResult) -> Document:
+    return Document(page_content=result.markdown, metadata=_document_metadata(result))
 
 
 class NabWebLoader(BaseLoader):
@@ -15,6 +37,13 @@ class NabWebLoader(BaseLoader):
 
     Each URL becomes a Document with page_content set to the markdown
     conversion and metadata containing url, status, and size.
+    Instances with the same binary, cookies and cache settings share one
+    NabLoader, and with it one background nab worker and result cache.
+    By default the last 1024 pages are cached for 5 minutes, so a URL set
+    loaded through both LangChain and LlamaIndex is fetched once.
+    Failed fetches and non-2xx responses are skipped by default; pass
+    ``accept_status`` (a predicate on the status code) to change that, or
+    None to keep every result.
 
     Example::
 
@@ -29,36 +58,42 @@ class NabWebLoader(BaseLoader):
         *,
         cookies: str = "auto",
         binary: Optional[str] = None,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = 300.0,
+        accept_status: Optional[Callable[[int], bool]] = _is_success,
     ) -> None:
         self.urls = urls
-        self._loader = NabLoader(binary=binary, cookies=cookies)
+        self._loader = _shared_loader(binary, cookies, cache_size, cache_ttl)
+        self._accept_status = accept_status
+
+    def _documents(self, results: Iterable[NabResult]) -> Iterator[Document]:
+        return map(_to_document, _accepted(results, self._accept_status))
 
     def lazy_load(self) -> Iterator[Document]:
-        """Yield Documents one at a time."""
-        for url in self.urls:
-            result = self._loader.fetch(url)
-            yield Document(
-                page_content=result.markdown,
-                metadata={
-                    "source": result.url,
-                    "status": result.status,
-                    "size": result.size,
-                    "time_ms": result.time_ms,
-                },
-            )
+        """Yield Documents as their fetches complete (not in input order)."""
+        return self._documents(self._loader.fetch_batch_iter(self.urls))
 
     def load(self) -> List[Document]:
         """Load all URLs in parallel and return Documents."""
-        results = self._loader.fetch_batch(self.urls)
-        return [
-            Document(
-                page_content=r.markdown,
-                metadata={
-                    "source": r.url,
-                    "status": r.status,
-                    "size": r.size,
-                    "time_ms": r.time_ms,
-                },
-            )
-            for r in results
-        ]
+        return list(self._documents(self._loader.fetch_batch(self.urls)))
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Async variant of :meth:`lazy_load`, without a worker thread."""
+        accept_status = self._accept_status
+        async for result in self._loader.afetch_batch_iter(self.urls):
+            if accept_status is None or accept_status(result.status):
+                yield _to_document(result)
+
+    async def aload(self) -> List[Document]:
+        """Async variant of :meth:`load`; same single nab process."""
+        return list(self._documents(await self._loader.afetch_batch(self.urls)))
+
+    def load_arrow(self) -> pa.RecordBatch:
+        """Load all URLs into one Arrow RecordBatch instead of Documents.
+
+        Columns: page_content, source, status, size, time_ms. Requires
+        ``pip install nab-loader[arrow]``.
+        """
+        return _results_to_arrow(
+            _accepted(self._loader.fetch_batch(self.urls), self._accept_status)
+        )
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional
 
 from llama_index.core import Document
 from llama_index.core.readers.base import BaseReader
 
-from nab_loader.core import NabLoader
+from nab_loader.core import (
+    NabResult,
+    _accepted,
+    _document_metadata,
+    _is_success,
+    _results_to_arrow,
+    _shared_loader,
+)
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _to_document(result: NabResult) -> Document:
+    return Document(text=result.markdown, metadata=_document_metadata(result))
 
 
 class NabWebReader(BaseReader):
@@ -15,6 +29,13 @@ class NabWebReader(BaseReader):
 
     Each URL becomes a Document with text set to the markdown
     conversion and metadata containing url, status, and size.
+    Instances with the same binary, cookies and cache settings share one
+    NabLoader, and with it one background nab worker and result cache.
+    By default the last 1024 pages are cached for 5 minutes, so a URL set
+    loaded through both LangChain and LlamaIndex is fetched once.
+    Failed fetches and non-2xx responses are skipped by default; pass
+    ``accept_status`` (a predicate on the status code) to change that, or
+    None to keep every result.
 
     Example::
 
@@ -28,22 +49,35 @@ class NabWebReader(BaseReader):
         *,
         cookies: str = "auto",
         binary: Optional[str] = None,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = 300.0,
+        accept_status: Optional[Callable[[int], bool]] = _is_success,
     ) -> None:
         super().__init__()
-        self._loader = NabLoader(binary=binary, cookies=cookies)
+        self._loader = _shared_loader(binary, cookies, cache_size, cache_ttl)
+        self._accept_status = accept_status
+
+    def _documents(self, results: Iterable[NabResult]) -> Iterator[Document]:
+        return map(_to_document, _accepted(results, self._accept_status))
+
+    def lazy_load_data(self, urls: List[str]) -> Iterator[Document]:
+        """Yield Documents as their fetches complete (not in input order)."""
+        return self._documents(self._loader.fetch_batch_iter(urls))
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Fetch URLs and return LlamaIndex Documents."""
-        results = self._loader.fetch_batch(urls)
-        return [
-            Document(
-                text=r.markdown,
-                metadata={
-                    "source": r.url,
-                    "status": r.status,
-                    "size": r.size,
-                    "time_ms": r.time_ms,
-                },
-            )
-            for r in results
-        ]
+        return list(self._documents(self._loader.fetch_batch(urls)))
+
+    async def aload_data(self, urls: List[str]) -> List[Document]:
+        """Async variant of :meth:`load_data`; same single nab process."""
+        return list(self._documents(await self._loader.afetch_batch(urls)))
+
+    def load_arrow(self, urls: List[str]) -> pa.RecordBatch:
+        """Fetch URLs into one Arrow RecordBatch instead of Documents.
+
+        Columns: page_content, source, status, size, time_ms. Requires
+        ``pip install nab-loader[arrow]``.
+        """
+        return _results_to_arrow(
+            _accepted(self._loader.fetch_batch(urls), self._accept_status)
+        )
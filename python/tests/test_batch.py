@@ -0,0 +1,85 @@
+"""fetch_batch against a stand-in nab that mimics ``fetch --batch -``."""
+
+import asyncio
+import json
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from nab_loader.core import NabLoader
+
+# Same line filter as cmd_fetch_batch: trim, skip blank and "#" lines
+FAKE_NAB = textwrap.dedent(
+    """\
+    import json, sys
+    lines = (line.strip() for line in sys.stdin.read().splitlines())
+    urls = [line for line in lines if line and not line.startswith("#")]
+    print(json.dumps([
+        {
+            "url": url,
+            "status": 503 if "flaky" in url else 200,
+            "markdown": "page " + url,
+            "elapsed_ms": 1.5,
+            "metadata": {"content_length": 42},
+        }
+        for url in urls
+    ]))
+    """
+)
+
+
+class FetchBatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        script = os.path.join(self._dir.name, "fake_nab.py")
+        with open(script, "w") as f:
+            f.write(FAKE_NAB)
+        self.binary = os.path.join(self._dir.name, "nab")
+        with open(self.binary, "w") as f:
+            f.write(f"#!/bin/sh\nexec {json.dumps(sys.executable)} {script}\n")
+        os.chmod(self.binary, os.stat(self.binary).st_mode | stat.S_IXUSR)
+        self.loader = NabLoader(binary=self.binary, daemon=False)
+
+    def tearDown(self) -> None:
+        self.loader.close()
+        self._dir.cleanup()
+
+    def test_skipped_lines_do_not_shift_results(self) -> None:
+        urls = ["https://a", "", "https://b", "#x", "https://c"]
+        results = self.loader.fetch_batch(urls)
+
+        self.assertEqual([r.url for r in results], urls)
+        self.assertEqual([r.status for r in results], [200, 0, 200, 0, 200])
+        self.assertEqual(results[2].markdown, "page https://b")
+        self.assertEqual(results[4].markdown, "page https://c")
+
+    def test_only_successes_are_cached(self) -> None:
+        loader = NabLoader(binary=self.binary, daemon=False, cache_size=8)
+        loader.fetch_batch(["https://a", "https://flaky"])
+
+        self.assertIsNotNone(loader._cache.get("https://a"))
+        self.assertIsNone(loader._cache.get("https://flaky"))
+
+    def test_size_and_time_come_from_nab_fields(self) -> None:
+        (result,) = self.loader.fetch_batch(["https://a"])
+
+        self.assertEqual(result.size, 42)
+        self.assertEqual(result.time_ms, 1.5)
+
+    def test_overlapping_chunks_keep_input_order(self) -> None:
+        urls = [f"https://{i}" for i in range(7)]
+        with mock.patch("nab_loader.core._BATCH_CHUNK", 2):
+            results = self.loader.fetch_batch(urls)
+            async_results = asyncio.run(self.loader.afetch_batch(urls))
+
+        for got in (results, async_results):
+            self.assertEqual([r.url for r in got], urls)
+            self.assertEqual([r.markdown for r in got], [f"page {u}" for u in urls])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""TinyLFUCache admission, decay, LRU order and TTL expiry."""
+
+import time
+import unittest
+
+from nab_loader.cache import TinyLFUCache, _FrequencySketch
+
+
+class FrequencySketchTest(unittest.TestCase):
+    def test_counters_saturate_at_fifteen(self) -> None:
+        sketch = _FrequencySketch(capacity=10)
+        for _ in range(20):
+            sketch.increment("hot")
+
+        self.assertEqual(sketch.estimate("hot"), 15)
+        self.assertEqual(sketch.estimate("cold"), 0)
+
+    def test_counters_halve_after_sample_size(self) -> None:
+        sketch = _FrequencySketch(capacity=1)  # sample_size 10
+        for _ in range(9):
+            sketch.increment("key")
+        self.assertEqual(sketch.estimate("key"), 9)
+
+        sketch.increment("key")
+        self.assertEqual(sketch.estimate("key"), 5)
+
+
+class TinyLFUCacheTest(unittest.TestCase):
+    def test_one_off_scan_does_not_evict_hot_key(self) -> None:
+        cache: TinyLFUCache[int] = TinyLFUCache(maxsize=8)  # sample_size 80
+        cache.put("hot", 1)
+        for _ in range(10):
+            cache.get("hot")
+
+        # Lookup-then-store, as NabLoader does for every URL it fetches;
+        # short enough that the counters are not halved along the way
+        for i in range(50):
+            key = f"scan-{i}"
+            if cache.get(key) is None:
+                cache.put(key, i)
+
+        self.assertEqual(cache.get("hot"), 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TinyLFUCache[str] = TinyLFUCache(maxsize=2)
+        cache.put("a", "a")
+        cache.put("b", "b")
+        cache.get("a")  # "b" is now the LRU entry
+        cache.get("c")
+        cache.put("c", "c")
+
+        self.assertEqual(cache.get("a"), "a")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "c")
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache: TinyLFUCache[int] = TinyLFUCache(maxsize=2, ttl=0.05)
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_expired_popular_entries_do_not_block_admission(self) -> None:
+        cache: TinyLFUCache[int] = TinyLFUCache(maxsize=2, ttl=0.05)
+        for key in ("a", "b"):
+            cache.put(key, 1)
+            for _ in range(5):
+                cache.get(key)
+        time.sleep(0.06)
+        self.assertEqual(len(cache), 0)
+
+        cache.put("c", 3)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
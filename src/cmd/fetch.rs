@@ -1,11 +1,12 @@
 use std::fs::File;
 use std::io::Write;
 use std::path::PathBuf;
+use std::sync::OnceLock;
 use std::time::Instant;
 
 use anyhow::Result;
 
-use nab::{AcceleratedClient, CookieSource, OnePasswordAuth};
+use nab::{AcceleratedClient, BrowserProfile, CookieSource, OnePasswordAuth};
 
 use super::output::output_body;
 use crate::OutputFormat;
@@ -33,6 +34,7 @@ pub async fn cmd_fetch(
     batch_file: Option<&str>,
     parallel: usize,
     proxy: Option<&str>,
+    accept_encoding: Option<&str>,
 ) -> Result<()> {
     // Handle batch mode
     if let Some(file_path) = batch_file {
@@ -55,13 +57,15 @@ pub async fn cmd_fetch(
             no_redirect,
             no_spa,
             proxy,
+            accept_encoding,
         )
         .await;
     }
 
     // Create client - with or without redirect following
     let client = build_client(no_redirect, proxy)?;
-    let profile = client.profile().await;
+    let mut profile = client.profile().await;
+    override_accept_encoding(&mut profile, accept_encoding);
 
     // Try site-specific providers first (e.g., Twitter via FxTwitter API)
     let site_router = nab::site::SiteRouter::new();
@@ -103,11 +107,34 @@ pub async fn cmd_fetch(
     // Handle 1Password
     if use_1password && OnePasswordAuth::is_available() {
         let auth = OnePasswordAuth::new(None);
-        if let Ok(Some(cred)) = auth.get_credential_for_url(url) {
-            if matches!(format, OutputFormat::Full) {
-                println!("🔐 Found 1Password: {}", cred.title);
+        match auth.get_credential_for_url(url) {
+            Ok(Some(cred)) => {
+                if matches!(format, OutputFormat::Full) {
+                    println!("🔐 Found 1Password: {}", cred.title);
+                    if let Some(ref username) = cred.username {
+                        println!("   Username: {username}");
+                    }
+                    if cred.totp.is_some() {
+                        println!("   TOTP: [present]");
+                    }
+                }
+            }
+            Ok(None) => {
+                if matches!(format, OutputFormat::Full) {
+                    println!("🔐 No 1Password credential for this URL");
+                }
+            }
+            Err(e) => {
+                // Keep machine-readable stdout clean in the other formats
+                if matches!(format, OutputFormat::Full) {
+                    println!("🔐 1Password lookup failed: {e}");
+                } else {
+                    eprintln!("🔐 1Password lookup failed: {e}");
+                }
             }
         }
+    } else if use_1password && matches!(format, OutputFormat::Full) {
+        println!("🔐 1Password CLI not available or not authenticated");
     }
 
     // Session warmup (for APIs that require prior page load)
@@ -352,12 +379,18 @@ async fn cmd_fetch_batch(
     no_redirect: bool,
     _no_spa: bool,
     proxy: Option<&str>,
+    accept_encoding: Option<&str>,
 ) -> Result<()> {
     use std::sync::Arc;
     use tokio::sync::Semaphore;
 
-    let contents = std::fs::read_to_string(file_path)
-        .map_err(|e| anyhow::anyhow!("Failed to read batch file '{}': {}", file_path, e))?;
+    let contents = if file_path == "-" {
+        std::io::read_to_string(std::io::stdin())
+            .map_err(|e| anyhow::anyhow!("Failed to read batch URLs from stdin: {}", e))?
+    } else {
+        std::fs::read_to_string(file_path)
+            .map_err(|e| anyhow::anyhow!("Failed to read batch file '{}': {}", file_path, e))?
+    };
 
     let urls: Vec<String> = contents
         .lines()
@@ -380,133 +413,28 @@ async fn cmd_fetch_batch(
     let mut handles = Vec::new();
 
     // Clone data we need to move into tasks
-    let custom_headers = custom_headers.to_vec();
-    let cookies = cookies.to_string();
-    let method = method.to_string();
-    let data = data.map(String::from);
-    let proxy_owned = proxy.map(String::from);
+    let opts = JsonFetchOptions {
+        cookies: cookies.to_string(),
+        method: method.to_string(),
+        data: data.map(String::from),
+        custom_headers: custom_headers.to_vec(),
+        auto_referer,
+        raw_html,
+        accept_encoding: accept_encoding.map(String::from),
+    };
+
+    // One client for the whole batch: URLs on the same host share its
+    // connection pool and HTTP/2 streams instead of handshaking per URL.
+    let client = Arc::new(build_client(no_redirect, proxy)?);
 
     for url in urls {
         let sem = semaphore.clone();
-        let custom_headers = custom_headers.clone();
-        let cookies = cookies.clone();
-        let method = method.clone();
-        let data = data.clone();
-        let proxy_owned = proxy_owned.clone();
+        let opts = opts.clone();
+        let client = Arc::clone(&client);
 
         let handle = tokio::spawn(async move {
             let _permit = sem.acquire().await.unwrap();
-            let start = Instant::now();
-
-            let client = match build_client(no_redirect, proxy_owned.as_deref()) {
-                Ok(c) => c,
-                Err(e) => {
-                    return serde_json::json!({
-                        "url": url,
-                        "error": e.to_string(),
-                    });
-                }
-            };
-            let profile = client.profile().await;
-
-            let domain = url::Url::parse(&url)
-                .ok()
-                .and_then(|u| u.host_str().map(std::string::ToString::to_string))
-                .unwrap_or_default();
-
-            let mut cookie_header = String::new();
-            let browser_name = resolve_browser_name(&cookies);
-            if let Some(browser) = &browser_name {
-                let source = resolve_cookie_source(browser);
-                cookie_header = source.get_cookie_header(&domain).unwrap_or_default();
-            }
-
-            let mut request = match method.to_uppercase().as_str() {
-                "POST" => client.inner().post(&url),
-                "PUT" => client.inner().put(&url),
-                "PATCH" => client.inner().patch(&url),
-                "DELETE" => client.inner().delete(&url),
-                "HEAD" => client.inner().head(&url),
-                _ => client.inner().get(&url),
-            };
-
-            if let Some(ref body_data) = data {
-                request = request.body(body_data.clone());
-                if !custom_headers
-                    .iter()
-                    .any(|h| h.to_lowercase().starts_with("content-type"))
-                {
-                    request = request.header("Content-Type", "application/json");
-                }
-            }
-
-            request = request.headers(profile.to_headers());
-            if !cookie_header.is_empty() {
-                request = request.header("Cookie", &cookie_header);
-            }
-
-            if auto_referer {
-                if let Ok(parsed) = url::Url::parse(&url) {
-                    let referer =
-                        format!("{}://{}/", parsed.scheme(), parsed.host_str().unwrap_or(""));
-                    request = request.header("Referer", referer);
-                }
-            }
-
-            for header_str in &custom_headers {
-                let parts: Vec<&str> = header_str.splitn(2, ':').collect();
-                if parts.len() == 2 {
-                    request = request.header(parts[0].trim(), parts[1].trim());
-                }
-            }
-
-            match request.send().await {
-                Ok(response) => {
-                    let elapsed = start.elapsed();
-                    let status = response.status().as_u16();
-                    let content_type = response
-                        .headers()
-                        .get("content-type")
-                        .and_then(|v| v.to_str().ok())
-                        .unwrap_or("text/html")
-                        .to_string();
-
-                    let body_bytes = response.bytes().await.unwrap_or_default();
-                    let body_len = body_bytes.len();
-                    let raw_text = String::from_utf8_lossy(&body_bytes).to_string();
-
-                    let markdown = if !raw_html {
-                        let router = nab::content::ContentRouter::new();
-                        router
-                            .convert(&body_bytes, &content_type)
-                            .map(|r| r.markdown)
-                            .unwrap_or_else(|_| raw_text.clone())
-                    } else {
-                        raw_text
-                    };
-
-                    let metadata = serde_json::json!({
-                        "title": extract_title(&String::from_utf8_lossy(&body_bytes)),
-                        "content_length": body_len,
-                        "content_type": content_type,
-                    });
-
-                    serde_json::json!({
-                        "url": url,
-                        "status": status,
-                        "content_type": content_type,
-                        "markdown": markdown,
-                        "metadata": metadata,
-                        "elapsed_ms": (elapsed.as_secs_f64() * 1000.0 * 10.0).round() / 10.0,
-                    })
-                }
-                Err(e) => {
-                    serde_json::json!({
-                        "url": url,
-                        "error": e.to_string(),
-                    })
-                }
-            }
+            fetch_json(&client, &url, &opts).await
         });
 
         handles.push(handle);
@@ -590,6 +518,157 @@ async fn cmd_fetch_batch(
     Ok(())
 }
 
+/// Per-request options for [`fetch_json`].
+#[derive(Clone)]
+pub(crate) struct JsonFetchOptions {
+    pub cookies: String,
+    pub method: String,
+    pub data: Option<String>,
+    pub custom_headers: Vec<String>,
+    pub auto_referer: bool,
+    pub raw_html: bool,
+    pub accept_encoding: Option<String>,
+}
+
+/// Replace the profile's Accept-Encoding with a caller preference.
+///
+/// reqwest still decodes zstd/br/gzip/deflate transparently; this only
+/// changes what we advertise. Values that aren't valid header text are
+/// ignored so they can't poison the profile's header map.
+fn override_accept_encoding(profile: &mut BrowserProfile, accept_encoding: Option<&str>) {
+    if let Some(value) = accept_encoding {
+        if reqwest::header::HeaderValue::from_str(value).is_ok() {
+            profile.accept_encoding = value.to_string();
+        }
+    }
+}
+
+/// Fetch one URL and describe it as a `--format json` object.
+///
+/// Shared by batch mode and `nab serve`. Failures are reported inline as
+/// `{"url": ..., "error": ...}` so one bad URL never aborts the caller.
+pub(crate) async fn fetch_json(
+    client: &AcceleratedClient,
+    url: &str,
+    opts: &JsonFetchOptions,
+) -> serde_json::Value {
+    let start = Instant::now();
+    let mut profile = client.profile().await;
+    override_accept_encoding(&mut profile, opts.accept_encoding.as_deref());
+
+    let domain = url::Url::parse(url)
+        .ok()
+        .and_then(|u| u.host_str().map(std::string::ToString::to_string))
+        .unwrap_or_default();
+
+    let mut cookie_header = String::new();
+    let browser_name = resolve_browser_name(&opts.cookies);
+    if let Some(browser) = &browser_name {
+        let source = resolve_cookie_source(browser);
+        cookie_header = source.get_cookie_header(&domain).unwrap_or_default();
+    }
+
+    let mut request = match opts.method.to_uppercase().as_str() {
+        "POST" => client.inner().post(url),
+        "PUT" => client.inner().put(url),
+        "PATCH" => client.inner().patch(url),
+        "DELETE" => client.inner().delete(url),
+        "HEAD" => client.inner().head(url),
+        _ => client.inner().get(url),
+    };
+
+    if let Some(ref body_data) = opts.data {
+        request = request.body(body_data.clone());
+        if !opts
+            .custom_headers
+            .iter()
+            .any(|h| h.to_lowercase().starts_with("content-type"))
+        {
+            request = request.header("Content-Type", "application/json");
+        }
+    }
+
+    request = request.headers(profile.to_headers());
+    if !cookie_header.is_empty() {
+        request = request.header("Cookie", &cookie_header);
+    }
+
+    if opts.auto_referer {
+        if let Ok(parsed) = url::Url::parse(url) {
+            let referer = format!("{}://{}/", parsed.scheme(), parsed.host_str().unwrap_or(""));
+            request = request.header("Referer", referer);
+        }
+    }
+
+    for header_str in &opts.custom_headers {
+        let parts: Vec<&str> = header_str.splitn(2, ':').collect();
+        if parts.len() == 2 {
+            request = request.header(parts[0].trim(), parts[1].trim());
+        }
+    }
+
+    match request.send().await {
+        Ok(response) => {
+            let elapsed = start.elapsed();
+            let status = response.status().as_u16();
+            let content_type = response
+                .headers()
+                .get("content-type")
+                .and_then(|v| v.to_str().ok())
+                .unwrap_or("text/html")
+                .to_string();
+
+            let body_bytes = response.bytes().await.unwrap_or_default();
+            let body_len = body_bytes.len();
+            let raw_text = String::from_utf8_lossy(&body_bytes).to_string();
+
+            let markdown = if !opts.raw_html {
+                let router = nab::content::ContentRouter::new();
+                let ct = content_type.clone();
+                let bytes = body_bytes.clone();
+                let converted = tokio::time::timeout(
+                    std::time::Duration::from_secs(60),
+                    tokio::task::spawn_blocking(move || router.convert(&bytes, &ct)),
+                )
+                .await;
+                match converted {
+                    Ok(Ok(Ok(result))) => result.markdown,
+                    Ok(_) => raw_text,
+                    Err(_) => {
+                        return serde_json::json!({
+                            "url": url,
+                            "error": "Content conversion timed out after 60s",
+                        });
+                    }
+                }
+            } else {
+                raw_text
+            };
+
+            let metadata = serde_json::json!({
+                "title": extract_title(&String::from_utf8_lossy(&body_bytes)),
+                "content_length": body_len,
+                "content_type": content_type,
+            });
+
+            serde_json::json!({
+                "url": url,
+                "status": status,
+                "content_type": content_type,
+                "markdown": markdown,
+                "metadata": metadata,
+                "elapsed_ms": (elapsed.as_secs_f64() * 1000.0 * 10.0).round() / 10.0,
+            })
+        }
+        Err(e) => {
+            serde_json::json!({
+                "url": url,
+                "error": e.to_string(),
+            })
+        }
+    }
+}
+
 /// Build HTTP client with optional proxy and redirect settings
 fn build_client(no_redirect: bool, proxy: Option<&str>) -> Result<AcceleratedClient> {
     // Check for proxy from argument or environment
@@ -624,14 +703,18 @@ fn build_client(no_redirect: bool, proxy: Option<&str>) -> Result<AcceleratedCli
 
 /// Resolve browser name from cookie flag
 pub fn resolve_browser_name(cookies: &str) -> Option<String> {
+    // Detection shells out (`defaults`/`xdg-settings`), so do it once per
+    // process rather than for every URL in a batch or serve worker
+    static DETECTED: OnceLock<String> = OnceLock::new();
+
     if cookies.to_lowercase() == "none" {
         None
     } else if cookies.to_lowercase() == "auto" {
-        if let Ok(detected) = nab::detect_default_browser() {
-            Some(detected.as_str().to_string())
-        } else {
-            Some("chrome".to_string()) // fallback
-        }
+        let detected = DETECTED.get_or_init(|| match nab::detect_default_browser() {
+            Ok(detected) => detected.as_str().to_string(),
+            Err(_) => "chrome".to_string(), // fallback
+        });
+        Some(detected.clone())
     } else {
         Some(cookies.to_string())
     }
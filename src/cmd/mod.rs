@@ -8,6 +8,7 @@ pub mod fingerprint;
 pub mod login;
 pub mod otp;
 pub mod output;
+pub mod serve;
 pub mod spa;
 pub mod stream;
 pub mod submit;
@@ -22,6 +23,7 @@ pub use fetch::cmd_fetch;
 pub use fingerprint::cmd_fingerprint;
 pub use login::cmd_login;
 pub use otp::cmd_otp;
+pub use serve::cmd_serve;
 pub use spa::cmd_spa;
 pub use stream::cmd_stream;
 pub use submit::cmd_submit;
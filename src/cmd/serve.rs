@@ -0,0 +1,122 @@
+//! `nab serve`: a long-lived fetch worker on a Unix domain socket.
+//!
+//! Protocol: one JSON request per line (`{"url": "...", "cookies": "..."}`),
+//! answered by a length-prefixed frame: the payload size as 10 ASCII digits
+//! and a newline, then a JSON object shaped like `nab fetch --format json`
+//! output. The prefix lets clients read the body in one exact-size read
+//! instead of scanning megabytes of markdown for a line terminator.
+//! All connections share a single HTTP client, so the connection pool, TLS
+//! sessions and DNS cache stay warm across requests.
+
+use std::path::Path;
+
+use anyhow::Result;
+
+#[cfg(unix)]
+use std::sync::Arc;
+
+#[cfg(unix)]
+use serde::Deserialize;
+#[cfg(unix)]
+use tokio::io::{AsyncBufReadExt, AsyncReadExt, AsyncWriteExt, BufReader};
+#[cfg(unix)]
+use tokio::net::UnixListener;
+
+#[cfg(unix)]
+use nab::AcceleratedClient;
+
+#[cfg(unix)]
+use super::fetch::{fetch_json, JsonFetchOptions};
+
+/// One line of the `nab serve` request stream.
+#[cfg(unix)]
+#[derive(Deserialize)]
+struct ServeRequest {
+    url: String,
+    /// Overrides the worker's `--cookies` source for this request.
+    cookies: Option<String>,
+}
+
+/// Serve fetch requests on `socket` until killed (or stdin closes).
+#[cfg(unix)]
+pub async fn cmd_serve(
+    socket: &Path,
+    cookies: &str,
+    raw_html: bool,
+    exit_with_stdin: bool,
+    accept_encoding: Option<&str>,
+) -> Result<()> {
+    if socket.exists() {
+        std::fs::remove_file(socket)?;
+    }
+    let listener = UnixListener::bind(socket)?;
+    let client = Arc::new(AcceleratedClient::new()?);
+    let defaults = Arc::new(JsonFetchOptions {
+        cookies: cookies.to_string(),
+        method: "GET".to_string(),
+        data: None,
+        custom_headers: Vec::new(),
+        auto_referer: false,
+        raw_html,
+        accept_encoding: accept_encoding.map(String::from),
+    });
+
+    // Tie our lifetime to the parent: when it closes our stdin, clean up.
+    if exit_with_stdin {
+        let socket = socket.to_path_buf();
+        tokio::spawn(async move {
+            let mut sink = Vec::new();
+            let _ = tokio::io::stdin().read_to_end(&mut sink).await;
+            let _ = std::fs::remove_file(&socket);
+            std::process::exit(0);
+        });
+    }
+
+    eprintln!("🔌 nab serve listening on {}", socket.display());
+
+    loop {
+        let (stream, _) = listener.accept().await?;
+        let client = Arc::clone(&client);
+        let defaults = Arc::clone(&defaults);
+
+        tokio::spawn(async move {
+            let (reader, mut writer) = stream.into_split();
+            let mut lines = BufReader::new(reader).lines();
+
+            while let Ok(Some(line)) = lines.next_line().await {
+                let response = match serde_json::from_str::<ServeRequest>(&line) {
+                    Ok(req) => match req.cookies {
+                        Some(cookies) => {
+                            let opts = JsonFetchOptions {
+                                cookies,
+                                ..(*defaults).clone()
+                            };
+                            fetch_json(&client, &req.url, &opts).await
+                        }
+                        None => fetch_json(&client, &req.url, &defaults).await,
+                    },
+                    Err(e) => serde_json::json!({ "error": format!("invalid request: {e}") }),
+                };
+
+                let payload = response.to_string();
+                let header = format!("{:010}\n", payload.len());
+                if writer.write_all(header.as_bytes()).await.is_err()
+                    || writer.write_all(payload.as_bytes()).await.is_err()
+                {
+                    break;
+                }
+            }
+        });
+    }
+}
+
+#[cfg(not(unix))]
+pub async fn cmd_serve(
+    _socket: &Path,
+    _cookies: &str,
+    _raw_html: bool,
+    _exit_with_stdin: bool,
+    _accept_encoding: Option<&str>,
+) -> Result<()> {
+    anyhow::bail!("nab serve requires Unix domain sockets")
+}
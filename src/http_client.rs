@@ -68,6 +68,9 @@ impl AcceleratedClient {
             // DNS ACCELERATION (via hickory-dns)
             // ═══════════════════════════════════════════════════════════════
             // Happy Eyeballs: Race IPv4 and IPv6, use fastest
+            //   hickory resolves A and AAAA together; hyper-util's connector
+            //   starts the second address family after a fixed 300ms delay
+            //   (reqwest does not expose it, so it is not configurable here)
             // DNS caching: Avoid repeated lookups
             // (Enabled via hickory-dns feature)
             // ═══════════════════════════════════════════════════════════════
@@ -61,8 +61,9 @@ enum OverlayStyleArg {
 enum Commands {
     /// Fetch a URL (token-optimized output available)
     Fetch {
-        /// URL to fetch
-        url: String,
+        /// URL to fetch (optional with --batch)
+        #[arg(required_unless_present = "batch")]
+        url: Option<String>,
 
         /// Show response headers
         #[arg(short = 'H', long)]
@@ -132,7 +133,7 @@ enum Commands {
         #[arg(long)]
         no_spa: bool,
 
-        /// Batch fetch URLs from file (one per line, # comments allowed)
+        /// Batch fetch URLs from file (one per line, # comments allowed; "-" reads stdin)
         #[arg(long)]
         batch: Option<String>,
 
@@ -143,6 +144,10 @@ enum Commands {
         /// Proxy URL (SOCKS5 or HTTP). Also checks HTTP_PROXY/HTTPS_PROXY/ALL_PROXY env vars.
         #[arg(long)]
         proxy: Option<String>,
+
+        /// Override the profile's Accept-Encoding (e.g. "zstd, br, gzip")
+        #[arg(long)]
+        accept_encoding: Option<String>,
     },
 
     /// Extract data from JavaScript-heavy SPA pages
@@ -395,6 +400,29 @@ enum Commands {
         format: OutputFormat,
     },
 
+    /// Run a long-lived fetch worker on a Unix socket (JSON requests, framed replies)
+    Serve {
+        /// Path of the Unix domain socket to listen on
+        #[arg(long)]
+        socket: PathBuf,
+
+        /// Default cookie source (auto, brave, chrome, firefox, safari, edge, none)
+        #[arg(short, long, default_value = "auto")]
+        cookies: String,
+
+        /// Return raw HTML instead of markdown
+        #[arg(long)]
+        raw_html: bool,
+
+        /// Exit when stdin reaches EOF (lets a parent process own the worker)
+        #[arg(long)]
+        exit_with_stdin: bool,
+
+        /// Override the profile's Accept-Encoding (e.g. "zstd, br, gzip")
+        #[arg(long)]
+        accept_encoding: Option<String>,
+    },
+
     /// Export or manage browser cookies
     Cookies {
         #[command(subcommand)]
@@ -455,9 +483,10 @@ async fn main() -> Result<()> {
             batch,
             parallel,
             proxy,
+            accept_encoding,
         } => {
             cmd::cmd_fetch(
-                &url,
+                url.as_deref().unwrap_or_default(),
                 headers,
                 body,
                 format,
@@ -478,6 +507,7 @@ async fn main() -> Result<()> {
                 batch.as_deref(),
                 parallel,
                 proxy.as_deref(),
+                accept_encoding.as_deref(),
             )
             .await?;
         }
@@ -628,6 +658,22 @@ async fn main() -> Result<()> {
         } => {
             cmd::cmd_login(&url, use_1password, save_session, &cookies, headers, format).await?;
         }
+        Commands::Serve {
+            socket,
+            cookies,
+            raw_html,
+            exit_with_stdin,
+            accept_encoding,
+        } => {
+            cmd::cmd_serve(
+                &socket,
+                &cookies,
+                raw_html,
+                exit_with_stdin,
+                accept_encoding.as_deref(),
+            )
+            .await?;
+        }
         Commands::Cookies { action } => match action {
             CookiesAction::Export { domain, cookies } => {
                 cmd::cmd_cookies("export", &domain, &cookies).await?;
@@ -83,7 +83,8 @@ fn fetch_help() {
         .assert()
         .success()
         .stdout(predicate::str::contains("Fetch a URL"))
-        .stdout(predicate::str::contains("<URL>"))
+        .stdout(predicate::str::contains("[URL]"))
+        .stdout(predicate::str::contains("--batch"))
         .stdout(predicate::str::contains("--cookies"))
         .stdout(predicate::str::contains("--raw-html"))
         .stdout(predicate::str::contains("--method"));
@@ -180,6 +181,18 @@ fn auth_help() {
         .stdout(predicate::str::contains("<URL>"));
 }
 
+#[test]
+fn serve_help() {
+    nab()
+        .args(["serve", "--help"])
+        .assert()
+        .success()
+        .stdout(predicate::str::contains("Unix socket"))
+        .stdout(predicate::str::contains("--socket"))
+        .stdout(predicate::str::contains("--exit-with-stdin"))
+        .stdout(predicate::str::contains("--accept-encoding"));
+}
+
 // ─── Subcommand argument validation ──────────────────────────────────────────
 
 #[test]
@@ -236,6 +249,15 @@ fn otp_missing_domain_fails() {
         .stderr(predicate::str::contains("<DOMAIN>"));
 }
 
+#[test]
+fn serve_missing_socket_fails() {
+    nab()
+        .arg("serve")
+        .assert()
+        .failure()
+        .stderr(predicate::str::contains("--socket"));
+}
+
 #[test]
 fn auth_missing_url_fails() {
     nab()
@@ -282,3 +304,66 @@ fn annotate_invalid_style_fails() {
         .failure()
         .stderr(predicate::str::contains("invalid value"));
 }
+
+// ─── serve protocol ──────────────────────────────────────────────────────────
+
+#[cfg(unix)]
+#[test]
+fn serve_answers_invalid_request_with_framed_error() {
+    use assert_cmd::cargo::CommandCargoExt;
+    use std::io::{Read, Write};
+    use std::os::unix::net::UnixStream;
+    use std::process::Stdio;
+    use std::time::{Duration, Instant};
+
+    let socket = std::env::temp_dir().join(format!("nab-serve-test-{}.sock", std::process::id()));
+    let mut child = std::process::Command::cargo_bin("nab")
+        .expect("binary 'nab' should be built")
+        .args(["serve", "--cookies", "none", "--socket"])
+        .arg(&socket)
+        .stdin(Stdio::null())
+        .stderr(Stdio::null())
+        .spawn()
+        .expect("nab serve should start");
+
+    // Wait for the listener to come up
+    let deadline = Instant::now() + Duration::from_secs(10);
+    let mut stream = loop {
+        match UnixStream::connect(&socket) {
+            Ok(stream) => break stream,
+            Err(_) if Instant::now() < deadline => std::thread::sleep(Duration::from_millis(20)),
+            Err(e) => {
+                let _ = child.kill();
+                panic!("nab serve did not listen on {}: {e}", socket.display());
+            }
+        }
+    };
+    stream
+        .set_read_timeout(Some(Duration::from_secs(10)))
+        .unwrap();
+
+    stream.write_all(b"not json\n").unwrap();
+    let mut header = [0u8; 11];
+    let read = stream.read_exact(&mut header);
+    let mut payload = Vec::new();
+    if read.is_ok() {
+        let len: usize = std::str::from_utf8(&header[..10]).unwrap().parse().unwrap();
+        payload.resize(len, 0);
+        stream.read_exact(&mut payload).unwrap();
+    }
+
+    let _ = child.kill();
+    let _ = child.wait();
+    let _ = std::fs::remove_file(&socket);
+
+    read.expect("serve should reply with a length header");
+    assert_eq!(header[10], b'\n', "header is ten digits and a newline");
+    assert!(header[..10].iter().all(u8::is_ascii_digit));
+    let reply: serde_json::Value = serde_json::from_slice(&payload).unwrap();
+    assert!(
+        reply["error"]
+            .as_str()
+            .is_some_and(|e| e.starts_with("invalid request")),
+        "unexpected reply: {reply}"
+    );
+}
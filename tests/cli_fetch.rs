@@ -364,6 +364,35 @@ fn fetch_no_redirect_captures_302() {
         .stdout(predicate::str::is_match(r"^302 ").unwrap());
 }
 
+// ─── Batch mode ─────────────────────────────────────────────────────────────
+
+#[test]
+fn fetch_batch_from_stdin_json() {
+    if !net_tests_enabled() {
+        return;
+    }
+
+    // No positional URL needed: the batch is read from stdin and emitted
+    // as one JSON array in input order.
+    nab()
+        .args([
+            "fetch",
+            "--batch",
+            "-",
+            "--format",
+            "json",
+            "--cookies",
+            "none",
+        ])
+        .write_stdin("https://example.com\nhttps://example.org\n")
+        .timeout(std::time::Duration::from_secs(30))
+        .assert()
+        .success()
+        .stdout(predicate::str::starts_with("["))
+        .stdout(predicate::str::contains(r#""url":"https://example.com""#))
+        .stdout(predicate::str::contains(r#""url":"https://example.org""#));
+}
+
 // ─── POST with data ─────────────────────────────────────────────────────────
 
 #[test]